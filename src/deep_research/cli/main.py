@@ -704,7 +704,7 @@ async def list_sessions(use_pager: bool = True) -> None:
     from datetime import timezone
 
     manager = await get_session_manager()
-    sessions = await manager.list_sessions(limit=50)
+    sessions = await manager.list_session_summaries(limit=50)
 
     if not sessions:
         console.print("[dim]No sessions found.[/dim]")
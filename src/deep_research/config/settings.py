@@ -69,6 +69,11 @@ class Settings(BaseSettings):
     checkpoint_interval_seconds: int = Field(
         default=60, ge=10, le=300, description="Interval for saving checkpoints"
     )
+    checkpoint_keep_count: int = Field(
+        default=5,
+        ge=0,
+        description="Checkpoints kept per session; older ones are pruned on save. 0 keeps all.",
+    )
 
     # Data Storage
     data_dir: Path = Field(default=Path("./data"), description="Data directory path")
@@ -240,6 +240,17 @@ class ResearchSession(BaseModel):
         return session
 
 
+class SessionSummary(BaseModel):
+    """Lightweight view of a session for listings, without plan or agent data."""
+
+    session_id: str
+    user_query: str
+    phase: ResearchPhase
+    created_at: datetime
+    updated_at: datetime
+    completed_at: datetime | None = None
+
+
 class StartResearchRequest(BaseModel):
     """Request to start a new research session."""
 
@@ -469,14 +469,14 @@ class ResearchOrchestrator:
             # Execute researcher
             executor = create_researcher_executor()
 
-        async def on_message(msg: StreamMessage) -> None:
-            """Handle streaming messages."""
-            if _is_terminal_signal(msg):
-                return
-            content = msg.content or ""
-            if msg.tool_name and not content:
-                content = f"Using {msg.tool_name}..."
-            progress.current_action = content[:200]
+            async def on_message(msg: StreamMessage) -> None:
+                """Handle streaming messages."""
+                if _is_terminal_signal(msg):
+                    return
+                content = msg.content or ""
+                if msg.tool_name and not content:
+                    content = f"Using {msg.tool_name}..."
+                progress.current_action = content[:200]
                 progress.progress_percent = min(progress.progress_percent + 5, 90)
                 await self._get_event_bus().publish(
                     AgentProgressEvent(
@@ -3,20 +3,40 @@
 import asyncio
 import json
 import logging
-from datetime import datetime, timezone
+import sqlite3
+import time
+import zlib
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import AsyncIterator, Callable, TypeVar
 
 import aiosqlite
+from pydantic import TypeAdapter
 
 from deep_research.config import get_settings
 from deep_research.models.research import (
+    AgentProgress,
+    AgentResult,
     Checkpoint,
     ResearchPhase,
+    ResearchPlan,
     ResearchSession,
+    SessionSummary,
 )
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Manager whose transaction() block the current task is inside, if any. Write
+# methods called within the block join it instead of taking the lock again.
+_active_transaction: ContextVar["SessionManager | None"] = ContextVar(
+    "_active_transaction", default=None
+)
+
 # Phase ordering for comparison (higher = more advanced in workflow)
 _PHASE_ORDER = {
     ResearchPhase.PLANNING: 0,
@@ -28,6 +48,149 @@ _PHASE_ORDER = {
     ResearchPhase.CANCELLED: 4,
 }
 
+# In-process read cache limits. The TTL keeps us from serving rows that another
+# process (e.g. the CLI next to the API server) may have rewritten meanwhile.
+_CACHE_MAX_ENTRIES = 128
+_CACHE_TTL_SECONDS = 1.0
+
+# Read-only sqlite3 connections kept open next to the single writer
+_READ_POOL_SIZE = 4
+
+# Prepared statements kept per connection. sqlite3 keys its cache on the SQL
+# text, and every query here is built from fixed strings, so the set of
+# distinct statements is small and all of them stay compiled.
+_STATEMENT_CACHE_SIZE = 256
+
+# Validate/serialize payloads in one pass through pydantic-core instead of
+# round-tripping through intermediate dicts and the stdlib json module. dump_json
+# returns UTF-8 bytes, which are stored as BLOBs without a decode/encode step.
+_PLAN_ADAPTER = TypeAdapter(ResearchPlan)
+_CHECKPOINT_ADAPTER = TypeAdapter(Checkpoint)
+_AGENT_PROGRESS_ADAPTER = TypeAdapter(dict[str, AgentProgress])
+_AGENT_RESULTS_ADAPTER = TypeAdapter(list[AgentResult])
+_SUMMARIES_ADAPTER = TypeAdapter(list[SessionSummary])
+
+# Large JSON payloads are stored zlib-compressed, tagged with this header. JSON
+# never starts with a NUL byte, so plain rows (including TEXT rows from older
+# databases) still decode as-is.
+_COMPRESSED_MAGIC = b"\x00zl"
+_COMPRESS_MIN_BYTES = 1024
+
+# Applied to every connection we open; journal_mode is persistent and only set
+# once by the writer.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -64000",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA foreign_keys = ON",
+)
+
+# Session columns with agent progress/results aggregated back from their child
+# tables into the JSON shapes _row_to_session expects. Use as "FROM sessions s".
+_SESSION_COLUMNS = """
+    s.session_id, s.user_query, s.detected_language, s.phase, s.plan_json,
+    s.final_report, s.error, s.created_at, s.updated_at, s.completed_at,
+    (
+        SELECT json_group_object(p.agent_key, json(p.progress_json))
+        FROM agent_progress p WHERE p.session_id = s.session_id
+    ) AS agent_progress_json,
+    (
+        SELECT json_group_array(json(r.result_json)) FROM (
+            SELECT result_json FROM agent_results
+            WHERE session_id = s.session_id ORDER BY idx
+        ) r
+    ) AS agent_results_json
+"""
+
+
+# Bumped whenever the on-disk layout changes; stored in PRAGMA user_version.
+# 1: INTEGER timestamps, agent data in child tables.
+_SCHEMA_VERSION = 1
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_micros(value: datetime) -> int:
+    """Convert a datetime to integer microseconds since the Unix epoch.
+
+    Naive datetimes are taken to be UTC. Integers compare and index more
+    cheaply than ISO strings and round-trip without losing precision.
+
+    Args:
+        value: The datetime to convert.
+
+    Returns:
+        Microseconds since 1970-01-01 UTC.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(value: int) -> datetime:
+    """Convert integer microseconds since the Unix epoch to a UTC datetime.
+
+    Args:
+        value: Microseconds since 1970-01-01 UTC.
+
+    Returns:
+        Timezone-aware UTC datetime.
+    """
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _iso_to_micros(value: str | None) -> int | None:
+    """Convert a legacy ISO-8601 timestamp column value to microseconds."""
+    return _to_micros(datetime.fromisoformat(value)) if value else None
+
+
+def _encode_payload(data: bytes) -> bytes:
+    """Compress a JSON payload for storage if it is large enough to benefit.
+
+    Args:
+        data: Serialized JSON.
+
+    Returns:
+        The original bytes, or tagged zlib-compressed bytes.
+    """
+    if len(data) < _COMPRESS_MIN_BYTES:
+        return data
+    return _COMPRESSED_MAGIC + zlib.compress(data)
+
+
+def _decode_payload(value: str | bytes) -> str | bytes:
+    """Undo _encode_payload, returning JSON ready for model_validate_json.
+
+    Args:
+        value: Stored column value.
+
+    Returns:
+        JSON as bytes, or text for rows written before BLOB storage.
+    """
+    if isinstance(value, bytes) and value.startswith(_COMPRESSED_MAGIC):
+        return zlib.decompress(value[len(_COMPRESSED_MAGIC):])
+    return value
+
+
+def _prefix_bounds(prefix: str) -> tuple[str, str]:
+    """Get the half-open TEXT range [low, high) of IDs starting with a prefix.
+
+    Comparing against a range lets SQLite seek the primary key index, whereas
+    ``LIKE 'abc%'`` scans the whole table under the default collation.
+
+    Args:
+        prefix: The ID prefix.
+
+    Returns:
+        Tuple of (inclusive lower bound, exclusive upper bound).
+    """
+    if not prefix:
+        return "", "\U0010ffff"
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
 
 def utc_now() -> datetime:
     """Get current UTC time as timezone-aware datetime."""
@@ -37,72 +200,359 @@ def utc_now() -> datetime:
 class SessionManager:
     """Manages research sessions and checkpoints using SQLite."""
 
-    def __init__(self, db_path: Path | str | None = None):
+    def __init__(
+        self,
+        db_path: Path | str | None = None,
+        checkpoint_keep_count: int | None = None,
+    ):
         """Initialize the session manager.
 
         Args:
             db_path: Path to SQLite database. Uses config default if None.
+            checkpoint_keep_count: Checkpoints kept per session, pruned on every
+                save (0 disables pruning). Uses config default if None.
         """
-        if db_path is None:
+        if db_path is None or checkpoint_keep_count is None:
             settings = get_settings()
-            db_path = settings.database_path
+            if db_path is None:
+                db_path = settings.database_path
+            if checkpoint_keep_count is None:
+                checkpoint_keep_count = settings.checkpoint_keep_count
         self.db_path = Path(db_path)
+        self.checkpoint_keep_count = checkpoint_keep_count
         self._db: aiosqlite.Connection | None = None
         self._lock = asyncio.Lock()
 
+        # Pool of plain sqlite3 connections for read-only queries, used from
+        # worker threads via asyncio.to_thread. In WAL mode they read in parallel
+        # with each other and with the aiosqlite writer above.
+        self._read_pool: asyncio.Queue[sqlite3.Connection] = asyncio.Queue()
+        self._read_pool_size = 0
+
+        # Session IDs written inside the open transaction(); their cache entries
+        # are dropped again once it commits or rolls back
+        self._tx_touched: set[str] = set()
+
+        # LRU caches: session_id -> (cached model, monotonic time it was stored)
+        self._session_cache: OrderedDict[str, tuple[ResearchSession, float]] = OrderedDict()
+        self._checkpoint_cache: OrderedDict[str, tuple[Checkpoint, float]] = OrderedDict()
+
     async def initialize(self) -> None:
         """Initialize the database and create tables if needed."""
         # Ensure parent directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         async with self._lock:
-            self._db = await aiosqlite.connect(str(self.db_path))
+            if self._db is not None:
+                return
+
+            self._db = await aiosqlite.connect(
+                str(self.db_path), cached_statements=_STATEMENT_CACHE_SIZE
+            )
             self._db.row_factory = aiosqlite.Row
 
-            # Create sessions table
-            await self._db.execute("""
-                CREATE TABLE IF NOT EXISTS sessions (
-                    session_id TEXT PRIMARY KEY,
-                    user_query TEXT NOT NULL,
-                    detected_language TEXT DEFAULT 'en',
-                    phase TEXT NOT NULL,
-                    plan_json TEXT,
-                    agent_progress_json TEXT,
-                    agent_results_json TEXT,
-                    final_report TEXT,
-                    error TEXT,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL,
-                    completed_at TEXT
-                )
+            # WAL lets the read connection run alongside writes, and with
+            # synchronous=NORMAL a commit no longer waits on an fsync
+            for pragma in _CONNECTION_PRAGMAS:
+                await self._db.execute(pragma)
+            await self._db.execute("PRAGMA journal_mode = WAL")
+            await self._db.execute("PRAGMA wal_autocheckpoint = 1000")
+
+            async with self._db.execute("PRAGMA user_version") as cursor:
+                version = (await cursor.fetchone())[0]
+            async with self._db.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sessions'"
+            ) as cursor:
+                has_tables = await cursor.fetchone() is not None
+            legacy = has_tables and version < _SCHEMA_VERSION
+
+            if legacy:
+                # Move the old tables aside (without rewriting references to them)
+                # so the current schema can be created and filled from them
+                await self._db.execute("PRAGMA foreign_keys = OFF")
+                await self._db.execute("PRAGMA legacy_alter_table = ON")
+                await self._db.execute("ALTER TABLE sessions RENAME TO legacy_sessions")
+                await self._db.execute("ALTER TABLE checkpoints RENAME TO legacy_checkpoints")
+
+            await self._create_tables(self._db)
+
+            if legacy:
+                await self._migrate_legacy_tables(self._db)
+                await self._db.commit()
+                await self._db.execute("PRAGMA legacy_alter_table = OFF")
+                await self._db.execute("PRAGMA foreign_keys = ON")
+
+            await self._create_indexes(self._db)
+            await self._db.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            await self._db.commit()
+            self._read_pool = asyncio.Queue()
+            for _ in range(_READ_POOL_SIZE):
+                conn = await asyncio.to_thread(self._open_read_connection)
+                self._read_pool.put_nowait(conn)
+            self._read_pool_size = _READ_POOL_SIZE
+            logger.info(f"Database initialized at {self.db_path}")
+
+    @staticmethod
+    async def _create_tables(db: aiosqlite.Connection) -> None:
+        """Create any missing tables in the current schema.
+
+        Args:
+            db: The writer connection.
+        """
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS sessions (
+                session_id TEXT PRIMARY KEY,
+                user_query TEXT NOT NULL,
+                detected_language TEXT DEFAULT 'en',
+                phase TEXT NOT NULL,
+                plan_json BLOB,
+                final_report TEXT,
+                error TEXT,
+                created_at INTEGER NOT NULL,
+                updated_at INTEGER NOT NULL,
+                completed_at INTEGER
+            )
+        """)
+
+        # Agent progress and results live in child tables so an update only
+        # rewrites the agents that actually changed
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS agent_progress (
+                session_id TEXT NOT NULL
+                    REFERENCES sessions(session_id) ON DELETE CASCADE,
+                agent_key TEXT NOT NULL,
+                progress_json TEXT NOT NULL,
+                PRIMARY KEY (session_id, agent_key)
+            ) WITHOUT ROWID
+        """)
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS agent_results (
+                session_id TEXT NOT NULL
+                    REFERENCES sessions(session_id) ON DELETE CASCADE,
+                idx INTEGER NOT NULL,
+                result_json TEXT NOT NULL,
+                PRIMARY KEY (session_id, idx)
+            ) WITHOUT ROWID
+        """)
+
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id TEXT NOT NULL,
+                checkpoint_json BLOB NOT NULL,
+                created_at INTEGER NOT NULL,
+                FOREIGN KEY (session_id) REFERENCES sessions(session_id)
+            )
+        """)
+
+    async def _create_indexes(self, db: aiosqlite.Connection) -> None:
+        """Create indexes and this connection's checkpoint pruning trigger.
+
+        Args:
+            db: The writer connection.
+        """
+        # Serve list_sessions (with and without a phase filter) straight from
+        # an index in created_at order instead of scanning and sorting
+        await db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_sessions_phase_created
+            ON sessions(phase, created_at DESC)
+        """)
+        await db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_sessions_created
+            ON sessions(created_at DESC)
+        """)
+
+        # Create index for faster checkpoint lookups
+        await db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_checkpoints_session
+            ON checkpoints(session_id, created_at DESC)
+        """)
+
+        # Prune old checkpoints inside the inserting transaction. The trigger is
+        # TEMP so each connection applies its own keep count without rewriting
+        # the shared schema.
+        if self.checkpoint_keep_count > 0:
+            await db.execute(f"""
+                CREATE TEMP TRIGGER IF NOT EXISTS trg_checkpoint_prune
+                AFTER INSERT ON main.checkpoints
+                BEGIN
+                    DELETE FROM checkpoints
+                    WHERE session_id = NEW.session_id AND id NOT IN (
+                        SELECT id FROM checkpoints
+                        WHERE session_id = NEW.session_id
+                        ORDER BY created_at DESC LIMIT {int(self.checkpoint_keep_count)}
+                    );
+                END
             """)
 
-            # Create checkpoints table
-            await self._db.execute("""
-                CREATE TABLE IF NOT EXISTS checkpoints (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    session_id TEXT NOT NULL,
-                    checkpoint_json TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    FOREIGN KEY (session_id) REFERENCES sessions(session_id)
+    async def _migrate_legacy_tables(self, db: aiosqlite.Connection) -> None:
+        """Copy rows from pre-versioned tables into the current schema.
+
+        Older databases store timestamps as ISO-8601 TEXT and may keep agent
+        progress/results inline on the sessions row. Timestamps are converted
+        to integer microseconds, inline agent data is moved to the child
+        tables, and the legacy tables are dropped.
+
+        Args:
+            db: The writer connection.
+        """
+        async with db.execute("PRAGMA table_info(legacy_sessions)") as cursor:
+            has_inline_agents = "agent_progress_json" in {
+                row["name"] async for row in cursor
+            }
+
+        async with db.execute("SELECT * FROM legacy_sessions") as cursor:
+            sessions = list(await cursor.fetchall())
+        await db.executemany(
+            """
+            INSERT INTO sessions (
+                session_id, user_query, detected_language, phase, plan_json,
+                final_report, error, created_at, updated_at, completed_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    row["session_id"],
+                    row["user_query"],
+                    row["detected_language"],
+                    row["phase"],
+                    row["plan_json"],
+                    row["final_report"],
+                    row["error"],
+                    _iso_to_micros(row["created_at"]),
+                    _iso_to_micros(row["updated_at"]),
+                    _iso_to_micros(row["completed_at"]),
                 )
-            """)
+                for row in sessions
+            ],
+        )
 
-            # Create index for faster checkpoint lookups
-            await self._db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_checkpoints_session
-                ON checkpoints(session_id, created_at DESC)
-            """)
+        if has_inline_agents:
+            for row in sessions:
+                progress = {}
+                if row["agent_progress_json"]:
+                    progress = _AGENT_PROGRESS_ADAPTER.validate_json(
+                        _decode_payload(row["agent_progress_json"])
+                    )
+                results = []
+                if row["agent_results_json"]:
+                    results = _AGENT_RESULTS_ADAPTER.validate_json(
+                        _decode_payload(row["agent_results_json"])
+                    )
+                await self._write_agent_rows(db, row["session_id"], progress, results)
 
-            await self._db.commit()
-            logger.info(f"Database initialized at {self.db_path}")
+        async with db.execute(
+            "SELECT id, session_id, checkpoint_json, created_at FROM legacy_checkpoints"
+        ) as cursor:
+            checkpoints = list(await cursor.fetchall())
+        await db.executemany(
+            """
+            INSERT INTO checkpoints (id, session_id, checkpoint_json, created_at)
+            VALUES (?, ?, ?, ?)
+            """,
+            [
+                (
+                    row["id"],
+                    row["session_id"],
+                    row["checkpoint_json"],
+                    _iso_to_micros(row["created_at"]),
+                )
+                for row in checkpoints
+            ],
+        )
+
+        await db.execute("DROP TABLE legacy_checkpoints")
+        await db.execute("DROP TABLE legacy_sessions")
+        logger.info(
+            f"Migrated {len(sessions)} sessions and {len(checkpoints)} checkpoints "
+            f"to schema version {_SCHEMA_VERSION}"
+        )
+
+    @staticmethod
+    async def _write_agent_rows(
+        db: aiosqlite.Connection,
+        session_id: str,
+        agent_progress: dict[str, AgentProgress],
+        agent_results: list[AgentResult],
+    ) -> None:
+        """Sync the agent child tables with a session's in-memory state.
+
+        Rows whose JSON is unchanged are left untouched by the upserts, so an
+        update only writes pages for agents that actually moved.
+
+        Args:
+            db: The writer connection.
+            session_id: The owning session.
+            agent_progress: Current progress keyed by agent.
+            agent_results: Current results in order.
+        """
+        await db.executemany(
+            """
+            INSERT INTO agent_progress (session_id, agent_key, progress_json)
+            VALUES (?, ?, ?)
+            ON CONFLICT (session_id, agent_key) DO UPDATE
+                SET progress_json = excluded.progress_json
+                WHERE progress_json IS NOT excluded.progress_json
+            """,
+            [
+                (session_id, key, progress.model_dump_json())
+                for key, progress in agent_progress.items()
+            ],
+        )
+        await db.execute(
+            """
+            DELETE FROM agent_progress
+            WHERE session_id = ? AND agent_key NOT IN (SELECT value FROM json_each(?))
+            """,
+            (session_id, json.dumps(list(agent_progress))),
+        )
+
+        await db.executemany(
+            """
+            INSERT INTO agent_results (session_id, idx, result_json)
+            VALUES (?, ?, ?)
+            ON CONFLICT (session_id, idx) DO UPDATE
+                SET result_json = excluded.result_json
+                WHERE result_json IS NOT excluded.result_json
+            """,
+            [
+                (session_id, idx, result.model_dump_json())
+                for idx, result in enumerate(agent_results)
+            ],
+        )
+        await db.execute(
+            "DELETE FROM agent_results WHERE session_id = ? AND idx >= ?",
+            (session_id, len(agent_results)),
+        )
+
+    def _open_read_connection(self) -> sqlite3.Connection:
+        """Open a read-only pool connection for _read."""
+        conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        conn.execute("PRAGMA query_only = ON")
+        return conn
 
     async def close(self) -> None:
         """Close the database connection."""
         async with self._lock:
             if self._db:
+                # Refresh planner statistics for tables whose shape changed
+                await self._db.execute("PRAGMA optimize")
                 await self._db.close()
                 self._db = None
+            # Wait for in-flight reads to hand their connections back
+            for _ in range(self._read_pool_size):
+                conn = await self._read_pool.get()
+                conn.close()
+            self._read_pool_size = 0
+            self._session_cache.clear()
+            self._checkpoint_cache.clear()
 
     async def _ensure_connected(self) -> aiosqlite.Connection:
         """Ensure database is connected."""
@@ -110,6 +560,107 @@ class SessionManager:
             await self.initialize()
         return self._db  # type: ignore
 
+    async def _read(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """Run a read-only query function on a worker thread.
+
+        Args:
+            fn: Callable receiving a pooled read connection. It runs off the
+                event loop, so it may also do row-to-model conversion.
+
+        Returns:
+            Whatever fn returns.
+        """
+        await self._ensure_connected()
+
+        conn = await self._read_pool.get()
+        try:
+            return await asyncio.to_thread(fn, conn)
+        finally:
+            self._read_pool.put_nowait(conn)
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Group several writes into a single BEGIN IMMEDIATE ... COMMIT.
+
+        Write methods awaited inside the block join this transaction instead of
+        committing individually, so a burst of writes costs one commit. The
+        whole block is rolled back if it raises. Nested blocks join the
+        outermost one.
+
+        Example:
+            async with manager.transaction():
+                await manager.update_session(session)
+                await manager.save_checkpoint(session)
+        """
+        if _active_transaction.get() is self:
+            yield
+            return
+
+        db = await self._ensure_connected()
+        async with self._lock:
+            token = _active_transaction.set(self)
+            try:
+                await db.execute("BEGIN IMMEDIATE")
+                try:
+                    yield
+                except BaseException:
+                    await db.rollback()
+                    raise
+                await db.commit()
+            finally:
+                _active_transaction.reset(token)
+                touched, self._tx_touched = self._tx_touched, set()
+                for session_id in touched:
+                    self._invalidate(session_id)
+
+    @asynccontextmanager
+    async def _write(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Yield the writer connection for one logical write.
+
+        Outside transaction() this takes the write lock and commits on exit;
+        inside it the statements simply join the open transaction.
+        """
+        db = await self._ensure_connected()
+        if _active_transaction.get() is self:
+            yield db
+            return
+
+        async with self._lock:
+            try:
+                yield db
+            except BaseException:
+                await db.rollback()
+                raise
+            await db.commit()
+
+    @staticmethod
+    def _cache_get(cache: OrderedDict, session_id: str):
+        """Return a private copy of a fresh cache entry, or None on miss."""
+        entry = cache.get(session_id)
+        if entry is None:
+            return None
+        value, stored_at = entry
+        if time.monotonic() - stored_at > _CACHE_TTL_SECONDS:
+            del cache[session_id]
+            return None
+        cache.move_to_end(session_id)
+        return value.model_copy(deep=True)
+
+    @staticmethod
+    def _cache_put(cache: OrderedDict, session_id: str, value) -> None:
+        """Store a private copy of value, evicting the least recently used entry."""
+        cache[session_id] = (value.model_copy(deep=True), time.monotonic())
+        cache.move_to_end(session_id)
+        while len(cache) > _CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+
+    def _invalidate(self, session_id: str) -> None:
+        """Drop cached state for a session after a write."""
+        self._session_cache.pop(session_id, None)
+        self._checkpoint_cache.pop(session_id, None)
+        if _active_transaction.get() is self:
+            self._tx_touched.add(session_id)
+
     async def create_session(self, session: ResearchSession) -> ResearchSession:
         """Create a new research session.
 
@@ -119,33 +670,32 @@ class SessionManager:
         Returns:
             The created session.
         """
-        db = await self._ensure_connected()
-
-        async with self._lock:
+        async with self._write() as db:
             await db.execute(
                 """
                 INSERT INTO sessions (
-                    session_id, user_query, detected_language, phase,
-                    plan_json, agent_progress_json, agent_results_json,
+                    session_id, user_query, detected_language, phase, plan_json,
                     final_report, error, created_at, updated_at, completed_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     session.session_id,
                     session.user_query,
                     session.detected_language,
                     session.phase.value,
-                    session.plan.model_dump_json() if session.plan else None,
-                    json.dumps({k: v.model_dump(mode="json") for k, v in session.agent_progress.items()}),
-                    json.dumps([r.model_dump(mode="json") for r in session.agent_results]),
+                    _encode_payload(_PLAN_ADAPTER.dump_json(session.plan))
+                    if session.plan
+                    else None,
                     session.final_report,
                     session.error,
-                    session.created_at.isoformat(),
-                    session.updated_at.isoformat(),
-                    session.completed_at.isoformat() if session.completed_at else None,
+                    _to_micros(session.created_at),
+                    _to_micros(session.updated_at),
+                    _to_micros(session.completed_at) if session.completed_at else None,
                 ),
             )
-            await db.commit()
+            await self._write_agent_rows(
+                db, session.session_id, session.agent_progress, session.agent_results
+            )
 
         logger.info(f"Created session {session.session_id}")
         return session
@@ -159,18 +709,23 @@ class SessionManager:
         Returns:
             The session or None if not found.
         """
-        db = await self._ensure_connected()
+        cached = self._cache_get(self._session_cache, session_id)
+        if cached is not None:
+            return cached
 
-        async with db.execute(
-            "SELECT * FROM sessions WHERE session_id = ?",
-            (session_id,),
-        ) as cursor:
-            row = await cursor.fetchone()
+        def fetch(conn: sqlite3.Connection) -> ResearchSession | None:
+            row = conn.execute(
+                f"SELECT {_SESSION_COLUMNS} FROM sessions s WHERE s.session_id = ?",
+                (session_id,),
+            ).fetchone()
+            return self._row_to_session(row) if row else None
 
-        if not row:
+        session = await self._read(fetch)
+        if session is None:
             return None
 
-        return self._row_to_session(row)
+        self._cache_put(self._session_cache, session_id, session)
+        return session
 
     async def find_session_by_prefix(self, prefix: str) -> ResearchSession | None:
         """Find a session by ID prefix.
@@ -181,14 +736,17 @@ class SessionManager:
         Returns:
             The session if exactly one match is found, None otherwise.
         """
-        db = await self._ensure_connected()
+        def fetch(conn: sqlite3.Connection) -> list[sqlite3.Row]:
+            return conn.execute(
+                f"""
+                SELECT {_SESSION_COLUMNS} FROM sessions s
+                WHERE s.session_id >= ? AND s.session_id < ?
+                ORDER BY s.created_at DESC LIMIT 2
+                """,
+                _prefix_bounds(prefix),
+            ).fetchall()
 
-        # Use LIKE for prefix matching
-        async with db.execute(
-            "SELECT * FROM sessions WHERE session_id LIKE ? ORDER BY created_at DESC",
-            (f"{prefix}%",),
-        ) as cursor:
-            rows = list(await cursor.fetchall())
+        rows = await self._read(fetch)
 
         if len(rows) == 0:
             logger.debug(f"No sessions found with prefix {prefix}")
@@ -208,16 +766,12 @@ class SessionManager:
         Returns:
             The updated session.
         """
-        db = await self._ensure_connected()
-
-        async with self._lock:
-            await db.execute(
+        async with self._write() as db:
+            cursor = await db.execute(
                 """
                 UPDATE sessions SET
                     phase = ?,
                     plan_json = ?,
-                    agent_progress_json = ?,
-                    agent_results_json = ?,
                     final_report = ?,
                     error = ?,
                     updated_at = ?,
@@ -226,17 +780,21 @@ class SessionManager:
                 """,
                 (
                     session.phase.value,
-                    session.plan.model_dump_json() if session.plan else None,
-                    json.dumps({k: v.model_dump(mode="json") for k, v in session.agent_progress.items()}),
-                    json.dumps([r.model_dump(mode="json") for r in session.agent_results]),
+                    _encode_payload(_PLAN_ADAPTER.dump_json(session.plan))
+                    if session.plan
+                    else None,
                     session.final_report,
                     session.error,
-                    session.updated_at.isoformat(),
-                    session.completed_at.isoformat() if session.completed_at else None,
+                    _to_micros(session.updated_at),
+                    _to_micros(session.completed_at) if session.completed_at else None,
                     session.session_id,
                 ),
             )
-            await db.commit()
+            if cursor.rowcount > 0:
+                await self._write_agent_rows(
+                    db, session.session_id, session.agent_progress, session.agent_results
+                )
+        self._invalidate(session.session_id)
 
         logger.debug(f"Updated session {session.session_id}")
         return session
@@ -250,9 +808,7 @@ class SessionManager:
         Returns:
             True if deleted, False if not found.
         """
-        db = await self._ensure_connected()
-
-        async with self._lock:
+        async with self._write() as db:
             # Delete checkpoints first (foreign key)
             await db.execute(
                 "DELETE FROM checkpoints WHERE session_id = ?",
@@ -263,13 +819,57 @@ class SessionManager:
                 "DELETE FROM sessions WHERE session_id = ?",
                 (session_id,),
             )
-            await db.commit()
+        self._invalidate(session_id)
 
         deleted = cursor.rowcount > 0
         if deleted:
             logger.info(f"Deleted session {session_id}")
         return deleted
 
+    @staticmethod
+    def _list_sessions_query(
+        limit: int, offset: int, phase: ResearchPhase | None
+    ) -> tuple[str, tuple]:
+        """Build the SQL and parameters for listing sessions."""
+        if phase:
+            query = f"""
+                SELECT {_SESSION_COLUMNS} FROM sessions s WHERE s.phase = ?
+                ORDER BY s.created_at DESC LIMIT ? OFFSET ?
+            """
+            return query, (phase.value, limit, offset)
+
+        query = f"""
+            SELECT {_SESSION_COLUMNS} FROM sessions s
+            ORDER BY s.created_at DESC LIMIT ? OFFSET ?
+        """
+        return query, (limit, offset)
+
+    async def iter_sessions(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        phase: ResearchPhase | None = None,
+    ) -> AsyncIterator[ResearchSession]:
+        """Iterate over sessions one row at a time.
+
+        Rows are converted lazily, so callers that stop early never pay for
+        the remaining sessions.
+
+        Args:
+            limit: Maximum number of sessions to yield.
+            offset: Number of sessions to skip.
+            phase: Optional phase filter.
+
+        Yields:
+            Sessions ordered by creation time, newest first.
+        """
+        db = await self._ensure_connected()
+        query, params = self._list_sessions_query(limit, offset, phase)
+
+        async with db.execute(query, params) as cursor:
+            async for row in cursor:
+                yield self._row_to_session(row)
+
     async def list_sessions(
         self,
         limit: int = 50,
@@ -286,25 +886,64 @@ class SessionManager:
         Returns:
             List of sessions.
         """
-        db = await self._ensure_connected()
+        query, params = self._list_sessions_query(limit, offset, phase)
 
+        def fetch(conn: sqlite3.Connection) -> list[ResearchSession]:
+            return [self._row_to_session(row) for row in conn.execute(query, params)]
+
+        return await self._read(fetch)
+
+    async def list_session_summaries(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        phase: ResearchPhase | None = None,
+    ) -> list[SessionSummary]:
+        """List lightweight session summaries with optional filtering.
+
+        Only the columns needed for a listing are read, and all rows are
+        validated in a single pydantic-core pass, so plans and agent data are
+        never loaded.
+
+        Args:
+            limit: Maximum number of sessions to return.
+            offset: Number of sessions to skip.
+            phase: Optional phase filter.
+
+        Returns:
+            List of summaries, newest first.
+        """
+        columns = "session_id, user_query, phase, created_at, updated_at, completed_at"
         if phase:
-            query = """
-                SELECT * FROM sessions WHERE phase = ?
+            query = f"""
+                SELECT {columns} FROM sessions WHERE phase = ?
                 ORDER BY created_at DESC LIMIT ? OFFSET ?
             """
-            params = (phase.value, limit, offset)
+            params: tuple = (phase.value, limit, offset)
         else:
-            query = """
-                SELECT * FROM sessions
+            query = f"""
+                SELECT {columns} FROM sessions
                 ORDER BY created_at DESC LIMIT ? OFFSET ?
             """
             params = (limit, offset)
 
-        async with db.execute(query, params) as cursor:
-            rows = await cursor.fetchall()
+        def fetch(conn: sqlite3.Connection) -> list[SessionSummary]:
+            rows = conn.execute(query, params).fetchall()
+            return _SUMMARIES_ADAPTER.validate_python(
+                [
+                    {
+                        **row,
+                        "created_at": _from_micros(row["created_at"]),
+                        "updated_at": _from_micros(row["updated_at"]),
+                        "completed_at": _from_micros(row["completed_at"])
+                        if row["completed_at"] is not None
+                        else None,
+                    }
+                    for row in map(dict, rows)
+                ]
+            )
 
-        return [self._row_to_session(row) for row in rows]
+        return await self._read(fetch)
 
     async def save_checkpoint(self, session: ResearchSession) -> str:
         """Save a checkpoint for a session.
@@ -315,10 +954,9 @@ class SessionManager:
         Returns:
             The checkpoint ID.
         """
-        db = await self._ensure_connected()
         checkpoint = session.to_checkpoint()
 
-        async with self._lock:
+        async with self._write() as db:
             cursor = await db.execute(
                 """
                 INSERT INTO checkpoints (session_id, checkpoint_json, created_at)
@@ -326,11 +964,11 @@ class SessionManager:
                 """,
                 (
                     session.session_id,
-                    checkpoint.model_dump_json(),
-                    checkpoint.checkpoint_time.isoformat(),
+                    _encode_payload(_CHECKPOINT_ADAPTER.dump_json(checkpoint)),
+                    _to_micros(checkpoint.checkpoint_time),
                 ),
             )
-            await db.commit()
+        self._invalidate(session.session_id)
 
         checkpoint_id = str(cursor.lastrowid)
         logger.info(f"Saved checkpoint {checkpoint_id} for session {session.session_id}")
@@ -345,22 +983,29 @@ class SessionManager:
         Returns:
             The latest checkpoint or None.
         """
-        db = await self._ensure_connected()
+        cached = self._cache_get(self._checkpoint_cache, session_id)
+        if cached is not None:
+            return cached
 
-        async with db.execute(
-            """
-            SELECT checkpoint_json FROM checkpoints
-            WHERE session_id = ?
-            ORDER BY created_at DESC LIMIT 1
-            """,
-            (session_id,),
-        ) as cursor:
-            row = await cursor.fetchone()
+        def fetch(conn: sqlite3.Connection) -> Checkpoint | None:
+            row = conn.execute(
+                """
+                SELECT checkpoint_json FROM checkpoints
+                WHERE session_id = ?
+                ORDER BY created_at DESC LIMIT 1
+                """,
+                (session_id,),
+            ).fetchone()
+            if not row:
+                return None
+            return Checkpoint.model_validate_json(_decode_payload(row["checkpoint_json"]))
 
-        if not row:
+        checkpoint = await self._read(fetch)
+        if checkpoint is None:
             return None
 
-        return Checkpoint.model_validate_json(row["checkpoint_json"])
+        self._cache_put(self._checkpoint_cache, session_id, checkpoint)
+        return checkpoint
 
     async def list_checkpoints(self, session_id: str) -> list[Checkpoint]:
         """List all checkpoints for a session.
@@ -371,19 +1016,21 @@ class SessionManager:
         Returns:
             List of checkpoints, newest first.
         """
-        db = await self._ensure_connected()
-
-        async with db.execute(
-            """
-            SELECT checkpoint_json FROM checkpoints
-            WHERE session_id = ?
-            ORDER BY created_at DESC
-            """,
-            (session_id,),
-        ) as cursor:
-            rows = await cursor.fetchall()
+        def fetch(conn: sqlite3.Connection) -> list[Checkpoint]:
+            rows = conn.execute(
+                """
+                SELECT checkpoint_json FROM checkpoints
+                WHERE session_id = ?
+                ORDER BY created_at DESC
+                """,
+                (session_id,),
+            )
+            return [
+                Checkpoint.model_validate_json(_decode_payload(row["checkpoint_json"]))
+                for row in rows
+            ]
 
-        return [Checkpoint.model_validate_json(row["checkpoint_json"]) for row in rows]
+        return await self._read(fetch)
 
     async def restore_from_checkpoint(self, session_id: str) -> ResearchSession | None:
         """Restore a session from its latest checkpoint or session table.
@@ -400,19 +1047,39 @@ class SessionManager:
         Returns:
             The restored session or None if not found.
         """
-        # First, try to resolve the full session_id and get session from table
+        db = await self._ensure_connected()
+
+        # Resolve the session row and its latest checkpoint in one round-trip
+        query = f"""
+            SELECT {_SESSION_COLUMNS}, (
+                SELECT c.checkpoint_json FROM checkpoints c
+                WHERE c.session_id = s.session_id
+                ORDER BY c.created_at DESC LIMIT 1
+            ) AS latest_checkpoint_json
+            FROM sessions s
+        """
         if len(session_id) < 36:  # UUID is 36 characters with dashes
-            # Try prefix matching
-            session = await self.find_session_by_prefix(session_id)
-            if not session:
-                logger.warning(f"No session found with prefix {session_id}")
-                return None
+            # Prefix matching; fetch two rows so ambiguity can be reported
+            query += """
+                WHERE s.session_id >= ? AND s.session_id < ?
+                ORDER BY s.created_at DESC LIMIT 2
+            """
+            params = _prefix_bounds(session_id)
         else:
-            session = await self.get_session(session_id)
-            if not session:
-                logger.warning(f"No session found with ID {session_id}")
-                return None
+            query += " WHERE s.session_id = ?"
+            params = (session_id,)
+
+        async with db.execute(query, params) as cursor:
+            rows = list(await cursor.fetchall())
 
+        if not rows:
+            logger.warning(f"No session found with ID {session_id}")
+            return None
+        if len(rows) > 1:
+            logger.warning(f"Multiple sessions found with prefix {session_id}, returning most recent")
+
+        row = rows[0]
+        session = self._row_to_session(row)
         full_session_id = session.session_id
 
         # For terminal states OR sessions with final report, return the session
@@ -427,8 +1094,10 @@ class SessionManager:
             return session
 
         # For resumable states, try to restore from checkpoint
-        checkpoint = await self.get_latest_checkpoint(full_session_id)
-        if checkpoint:
+        if row["latest_checkpoint_json"]:
+            checkpoint = Checkpoint.model_validate_json(
+                _decode_payload(row["latest_checkpoint_json"])
+            )
             restored_session = ResearchSession.from_checkpoint(checkpoint)
             # Preserve critical fields from the database session that may not be in checkpoint
             restored_session.final_report = session.final_report
@@ -458,40 +1127,25 @@ class SessionManager:
         Returns:
             Number of checkpoints deleted.
         """
-        db = await self._ensure_connected()
-
-        async with self._lock:
-            # Get IDs to keep
-            async with db.execute(
-                """
-                SELECT id FROM checkpoints
-                WHERE session_id = ?
-                ORDER BY created_at DESC LIMIT ?
-                """,
-                (session_id, keep_count),
-            ) as cursor:
-                keep_ids = [row["id"] for row in await cursor.fetchall()]
-
-            if not keep_ids:
-                return 0
-
-            # Delete all except kept
-            placeholders = ",".join("?" * len(keep_ids))
+        async with self._write() as db:
             cursor = await db.execute(
-                f"""
+                """
                 DELETE FROM checkpoints
-                WHERE session_id = ? AND id NOT IN ({placeholders})
+                WHERE session_id = ? AND id NOT IN (
+                    SELECT id FROM checkpoints
+                    WHERE session_id = ?
+                    ORDER BY created_at DESC LIMIT ?
+                )
                 """,
-                (session_id, *keep_ids),
+                (session_id, session_id, keep_count),
             )
-            await db.commit()
 
         deleted = cursor.rowcount
         if deleted > 0:
             logger.info(f"Cleaned up {deleted} old checkpoints for session {session_id}")
         return deleted
 
-    def _row_to_session(self, row: aiosqlite.Row) -> ResearchSession:
+    def _row_to_session(self, row: sqlite3.Row) -> ResearchSession:
         """Convert a database row to a ResearchSession.
 
         Args:
@@ -500,27 +1154,21 @@ class SessionManager:
         Returns:
             ResearchSession instance.
         """
-        from deep_research.models.research import (
-            AgentProgress,
-            AgentResult,
-            ResearchPlan,
-        )
-
         plan = None
         if row["plan_json"]:
-            plan = ResearchPlan.model_validate_json(row["plan_json"])
+            plan = ResearchPlan.model_validate_json(_decode_payload(row["plan_json"]))
 
         agent_progress = {}
         if row["agent_progress_json"]:
-            progress_data = json.loads(row["agent_progress_json"])
-            agent_progress = {
-                k: AgentProgress.model_validate(v) for k, v in progress_data.items()
-            }
+            agent_progress = _AGENT_PROGRESS_ADAPTER.validate_json(
+                row["agent_progress_json"]
+            )
 
         agent_results = []
         if row["agent_results_json"]:
-            results_data = json.loads(row["agent_results_json"])
-            agent_results = [AgentResult.model_validate(r) for r in results_data]
+            agent_results = _AGENT_RESULTS_ADAPTER.validate_json(
+                row["agent_results_json"]
+            )
 
         return ResearchSession(
             session_id=row["session_id"],
@@ -532,10 +1180,10 @@ class SessionManager:
             agent_results=agent_results,
             final_report=row["final_report"],
             error=row["error"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            updated_at=datetime.fromisoformat(row["updated_at"]),
-            completed_at=datetime.fromisoformat(row["completed_at"])
-            if row["completed_at"]
+            created_at=_from_micros(row["created_at"]),
+            updated_at=_from_micros(row["updated_at"]),
+            completed_at=_from_micros(row["completed_at"])
+            if row["completed_at"] is not None
             else None,
         )
 
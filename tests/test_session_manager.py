@@ -1,6 +1,8 @@
 """Tests for session manager."""
 
 import asyncio
+import json
+import sqlite3
 from pathlib import Path
 
 import pytest
@@ -87,6 +89,40 @@ class TestSessionManager:
         result = await session_manager.get_session("nonexistent-id")
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_find_session_by_prefix(
+        self, session_manager: SessionManager
+    ) -> None:
+        """Test prefix lookup matches only IDs that start with the prefix."""
+        await session_manager.create_session(
+            ResearchSession(session_id="abc12345-one", user_query="Query 1")
+        )
+        await session_manager.create_session(
+            ResearchSession(session_id="abd00000-two", user_query="Query 2")
+        )
+
+        found = await session_manager.find_session_by_prefix("abc1")
+        assert found is not None
+        assert found.session_id == "abc12345-one"
+        assert await session_manager.find_session_by_prefix("ab_1") is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads(
+        self, session_manager: SessionManager
+    ) -> None:
+        """Test that more concurrent reads than pooled connections all complete."""
+        sessions = [ResearchSession(user_query=f"Query {i}") for i in range(10)]
+        for session in sessions:
+            await session_manager.create_session(session)
+
+        results = await asyncio.gather(
+            *(session_manager.get_session(s.session_id) for s in sessions),
+            session_manager.list_sessions(),
+        )
+
+        assert [r.session_id for r in results[:-1]] == [s.session_id for s in sessions]
+        assert len(results[-1]) == 10
+
     @pytest.mark.asyncio
     async def test_update_session(
         self, session_manager: SessionManager, sample_session: ResearchSession
@@ -147,6 +183,77 @@ class TestSessionManager:
         assert "agent-1" in retrieved.agent_progress
         assert retrieved.agent_progress["agent-1"].progress_percent == 50.0
 
+    @pytest.mark.asyncio
+    async def test_update_session_syncs_agent_rows(
+        self, session_manager: SessionManager, sample_session: ResearchSession
+    ) -> None:
+        """Test that removed agents and dropped results do not linger."""
+        session = sample_session
+        for i in range(3):
+            session.update_agent_progress(
+                AgentProgress(agent_id=f"agent-{i}", plan_item_id=f"item-{i}", topic=f"Topic {i}")
+            )
+            session.add_agent_result(
+                AgentResult(
+                    agent_id=f"agent-{i}",
+                    plan_item_id=f"item-{i}",
+                    topic=f"Topic {i}",
+                    findings=f"Findings {i}",
+                )
+            )
+        await session_manager.create_session(session)
+
+        del session.agent_progress["agent-1"]
+        session.agent_results = session.agent_results[::2]
+        await session_manager.update_session(session)
+
+        retrieved = await session_manager.get_session(session.session_id)
+        assert retrieved is not None
+        assert sorted(retrieved.agent_progress) == ["agent-0", "agent-2"]
+        assert [r.findings for r in retrieved.agent_results] == ["Findings 0", "Findings 2"]
+
+    @pytest.mark.asyncio
+    async def test_migrates_inline_agent_columns(self, tmp_path: Path) -> None:
+        """Test that agent data from the old single-table schema is carried over."""
+        db_path = tmp_path / "legacy.db"
+        session = ResearchSession(user_query="Legacy query")
+        progress = {"agent-1": AgentProgress(agent_id="agent-1", plan_item_id="i", topic="T")}
+        results = [AgentResult(agent_id="agent-1", plan_item_id="i", topic="T", findings="F")]
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE sessions (
+                session_id TEXT PRIMARY KEY, user_query TEXT NOT NULL,
+                detected_language TEXT DEFAULT 'en', phase TEXT NOT NULL,
+                plan_json TEXT, agent_progress_json TEXT, agent_results_json TEXT,
+                final_report TEXT, error TEXT, created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL, completed_at TEXT
+            )
+        """)
+        conn.execute(
+            "INSERT INTO sessions VALUES (?, ?, 'en', ?, NULL, ?, ?, NULL, NULL, ?, ?, NULL)",
+            (
+                session.session_id,
+                session.user_query,
+                session.phase.value,
+                json.dumps({k: v.model_dump(mode="json") for k, v in progress.items()}),
+                json.dumps([r.model_dump(mode="json") for r in results]),
+                session.created_at.isoformat(),
+                session.updated_at.isoformat(),
+            ),
+        )
+        conn.commit()
+        conn.close()
+
+        manager = SessionManager(db_path=db_path)
+        await manager.initialize()
+        retrieved = await manager.get_session(session.session_id)
+        await manager.close()
+
+        assert retrieved is not None
+        assert retrieved.agent_progress["agent-1"].topic == "T"
+        assert retrieved.agent_results[0].findings == "F"
+
     @pytest.mark.asyncio
     async def test_delete_session(
         self, session_manager: SessionManager, sample_session: ResearchSession
@@ -219,6 +326,58 @@ class TestSessionManager:
         assert len(planning) == 1
         assert len(completed) == 2
 
+    @pytest.mark.asyncio
+    async def test_list_sessions_query_uses_index(
+        self, session_manager: SessionManager
+    ) -> None:
+        """Test that listing sessions reads in index order without a sort step."""
+        db = await session_manager._ensure_connected()
+        for phase in (ResearchPhase.COMPLETED, None):
+            query, params = session_manager._list_sessions_query(10, 0, phase)
+            async with db.execute(f"EXPLAIN QUERY PLAN {query}", params) as cursor:
+                plan = " ".join(row["detail"] for row in await cursor.fetchall())
+            assert "idx_sessions_" in plan
+            assert "TEMP B-TREE" not in plan
+
+    @pytest.mark.asyncio
+    async def test_list_session_summaries(
+        self, session_manager: SessionManager, sample_session_with_plan: ResearchSession
+    ) -> None:
+        """Test listing lightweight summaries."""
+        await session_manager.create_session(sample_session_with_plan)
+        done = ResearchSession(user_query="Finished query")
+        done.update_phase(ResearchPhase.COMPLETED)
+        await session_manager.create_session(done)
+
+        summaries = await session_manager.list_session_summaries()
+        assert {s.session_id for s in summaries} == {
+            sample_session_with_plan.session_id,
+            done.session_id,
+        }
+
+        completed = await session_manager.list_session_summaries(
+            phase=ResearchPhase.COMPLETED
+        )
+        assert len(completed) == 1
+        assert completed[0].user_query == "Finished query"
+        assert completed[0].created_at == done.created_at
+        assert completed[0].completed_at is not None
+
+    @pytest.mark.asyncio
+    async def test_iter_sessions_newest_first(
+        self, session_manager: SessionManager
+    ) -> None:
+        """Test iterating sessions lazily in creation order."""
+        for i in range(3):
+            await session_manager.create_session(ResearchSession(user_query=f"Query {i}"))
+            await asyncio.sleep(0.01)
+
+        queries = [
+            session.user_query
+            async for session in session_manager.iter_sessions(limit=2)
+        ]
+        assert queries == ["Query 2", "Query 1"]
+
 
 class TestCheckpoints:
     """Test checkpoint functionality."""
@@ -291,6 +450,87 @@ class TestCheckpoints:
         assert restored.phase == session.phase
         assert restored.plan is not None
 
+    @pytest.mark.asyncio
+    async def test_restore_from_checkpoint_by_prefix(
+        self, session_manager: SessionManager, sample_session_with_plan: ResearchSession
+    ) -> None:
+        """Test restoring with a short ID prefix uses the latest checkpoint."""
+        session = sample_session_with_plan
+        await session_manager.create_session(session)
+        await session_manager.save_checkpoint(session)
+
+        session.agent_results.append(
+            AgentResult(
+                agent_id="agent-1",
+                plan_item_id="item-1",
+                topic="Solar Energy",
+                findings="Latest findings",
+            )
+        )
+        await session_manager.save_checkpoint(session)
+
+        restored = await session_manager.restore_from_checkpoint(session.session_id[:8])
+        assert restored is not None
+        assert restored.session_id == session.session_id
+        assert len(restored.agent_results) == 1
+
+    @pytest.mark.asyncio
+    async def test_large_checkpoint_is_compressed(
+        self, session_manager: SessionManager, sample_session_with_plan: ResearchSession
+    ) -> None:
+        """Test that large checkpoints are stored compressed and load back intact."""
+        session = sample_session_with_plan
+        session.agent_results.append(
+            AgentResult(
+                agent_id="agent-1",
+                plan_item_id="item-1",
+                topic="Solar Energy",
+                findings="Solar capacity keeps growing. " * 200,
+            )
+        )
+        await session_manager.create_session(session)
+        await session_manager.save_checkpoint(session)
+
+        db = await session_manager._ensure_connected()
+        async with db.execute("SELECT checkpoint_json FROM checkpoints") as cursor:
+            row = await cursor.fetchone()
+        assert isinstance(row["checkpoint_json"], bytes)
+
+        latest = await session_manager.get_latest_checkpoint(session.session_id)
+        assert latest is not None
+        assert latest.agent_results[0].findings == session.agent_results[0].findings
+
+    @pytest.mark.asyncio
+    async def test_reads_legacy_text_payloads(
+        self, session_manager: SessionManager, sample_session_with_plan: ResearchSession
+    ) -> None:
+        """Test that JSON stored as TEXT by older versions still loads."""
+        session = sample_session_with_plan
+        await session_manager.create_session(session)
+
+        db = await session_manager._ensure_connected()
+        await db.execute(
+            "UPDATE sessions SET plan_json = ? WHERE session_id = ?",
+            (session.plan.model_dump_json(), session.session_id),
+        )
+        await db.execute(
+            "INSERT INTO checkpoints (session_id, checkpoint_json, created_at) "
+            "VALUES (?, ?, ?)",
+            (
+                session.session_id,
+                session.to_checkpoint().model_dump_json(),
+                "2100-01-01T00:00:00+00:00",
+            ),
+        )
+        await db.commit()
+
+        stored = await session_manager.get_session(session.session_id)
+        assert stored is not None
+        assert stored.plan == session.plan
+        latest = await session_manager.get_latest_checkpoint(session.session_id)
+        assert latest is not None
+        assert latest.session_id == session.session_id
+
     @pytest.mark.asyncio
     async def test_restore_nonexistent_checkpoint(
         self, session_manager: SessionManager
@@ -301,24 +541,48 @@ class TestCheckpoints:
 
     @pytest.mark.asyncio
     async def test_cleanup_old_checkpoints(
-        self, session_manager: SessionManager, sample_session_with_plan: ResearchSession
+        self, tmp_path: Path, sample_session_with_plan: ResearchSession
     ) -> None:
         """Test cleaning up old checkpoints."""
+        manager = SessionManager(
+            db_path=tmp_path / "manual.db", checkpoint_keep_count=0
+        )
+        await manager.initialize()
         session = sample_session_with_plan
-        await session_manager.create_session(session)
+        await manager.create_session(session)
 
         # Create 10 checkpoints
         for _ in range(10):
-            await session_manager.save_checkpoint(session)
+            await manager.save_checkpoint(session)
 
         # Cleanup, keeping only 3
-        deleted = await session_manager.cleanup_old_checkpoints(
+        deleted = await manager.cleanup_old_checkpoints(
             session.session_id, keep_count=3
         )
         assert deleted == 7
 
-        remaining = await session_manager.list_checkpoints(session.session_id)
+        remaining = await manager.list_checkpoints(session.session_id)
         assert len(remaining) == 3
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_save_checkpoint_prunes_automatically(
+        self, tmp_path: Path, sample_session_with_plan: ResearchSession
+    ) -> None:
+        """Test that saving checkpoints keeps only the configured number."""
+        manager = SessionManager(
+            db_path=tmp_path / "auto.db", checkpoint_keep_count=3
+        )
+        await manager.initialize()
+        session = sample_session_with_plan
+        await manager.create_session(session)
+
+        for _ in range(6):
+            await manager.save_checkpoint(session)
+
+        remaining = await manager.list_checkpoints(session.session_id)
+        assert len(remaining) == 3
+        await manager.close()
 
     @pytest.mark.asyncio
     async def test_delete_session_deletes_checkpoints(
@@ -334,3 +598,79 @@ class TestCheckpoints:
 
         checkpoints = await session_manager.list_checkpoints(session.session_id)
         assert len(checkpoints) == 0
+
+
+class TestReadCache:
+    """Test the in-process session/checkpoint cache."""
+
+    @pytest.mark.asyncio
+    async def test_cached_session_is_isolated_copy(
+        self, session_manager: SessionManager, sample_session: ResearchSession
+    ) -> None:
+        """Test that mutating a returned session doesn't leak into the cache."""
+        await session_manager.create_session(sample_session)
+
+        first = await session_manager.get_session(sample_session.session_id)
+        assert first is not None
+        first.final_report = "local edit"
+
+        second = await session_manager.get_session(sample_session.session_id)
+        assert second is not None
+        assert second is not first
+        assert second.final_report is None
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_cache(
+        self, session_manager: SessionManager, sample_session_with_plan: ResearchSession
+    ) -> None:
+        """Test that update_session and save_checkpoint refresh cached reads."""
+        session = sample_session_with_plan
+        await session_manager.create_session(session)
+        await session_manager.save_checkpoint(session)
+
+        assert await session_manager.get_session(session.session_id) is not None
+        assert await session_manager.get_latest_checkpoint(session.session_id) is not None
+
+        session.update_phase(ResearchPhase.SYNTHESIZING)
+        await session_manager.update_session(session)
+        await session_manager.save_checkpoint(session)
+
+        retrieved = await session_manager.get_session(session.session_id)
+        checkpoint = await session_manager.get_latest_checkpoint(session.session_id)
+        assert retrieved is not None and retrieved.phase == ResearchPhase.SYNTHESIZING
+        assert checkpoint is not None and checkpoint.phase == ResearchPhase.SYNTHESIZING
+
+
+class TestTransactions:
+    """Test grouping writes into one transaction."""
+
+    @pytest.mark.asyncio
+    async def test_transaction_commits_all_writes(
+        self, session_manager: SessionManager, sample_session_with_plan: ResearchSession
+    ) -> None:
+        """Test that writes inside a transaction are all visible afterwards."""
+        session = sample_session_with_plan
+        async with session_manager.transaction():
+            await session_manager.create_session(session)
+            session.update_phase(ResearchPhase.RESEARCHING)
+            await session_manager.update_session(session)
+            await session_manager.save_checkpoint(session)
+
+        stored = await session_manager.get_session(session.session_id)
+        assert stored is not None
+        assert stored.phase == ResearchPhase.RESEARCHING
+        assert await session_manager.get_latest_checkpoint(session.session_id) is not None
+
+    @pytest.mark.asyncio
+    async def test_transaction_rolls_back_on_error(
+        self, session_manager: SessionManager, sample_session: ResearchSession
+    ) -> None:
+        """Test that an exception discards every write in the block."""
+        with pytest.raises(RuntimeError):
+            async with session_manager.transaction():
+                await session_manager.create_session(sample_session)
+                await session_manager.save_checkpoint(sample_session)
+                raise RuntimeError("boom")
+
+        assert await session_manager.get_session(sample_session.session_id) is None
+        assert await session_manager.list_checkpoints(sample_session.session_id) == []